@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <borchers@bwl.uni-mannheim.de>
+# Copyright (C) 2019 Oliver Borchers
+
+"""Optional numba routines for the oov ngram path of :func:`~fse.models.average.train_average_np`.
+
+Only used if numba is installed. The hashing is equivalent to
+:func:`~gensim.models.utils_any2vec.ft_ngram_hashes` with ``fb_compatible=True``.
+
+"""
+
+from numba import njit
+
+from numpy import ndarray, empty, zeros, frombuffer, fromiter, cumsum, int64, uint8, float32 as REAL
+
+from typing import List
+
+FT_HASH_OFFSET = 2166136261
+FT_HASH_PRIME = 16777619
+
+def encode_words(words:List[str]) -> [ndarray, ndarray]:
+    """ Encode words into a single flat utf-8 buffer
+
+    Parameters
+    ----------
+    words : list of str
+        The words to encode. Each word is wrapped in the "<" and ">" boundary markers.
+
+    Returns
+    -------
+    ndarray, ndarray
+        uint8 view of the buffer and the len(words) + 1 offsets of the words within the buffer.
+
+    """
+    encoded = [f"<{word}>".encode("utf-8") for word in words]
+    offsets = zeros(len(encoded) + 1, dtype=int64)
+    offsets[1:] = cumsum(fromiter(map(len, encoded), dtype=int64, count=len(encoded)))
+    return frombuffer(b"".join(encoded), dtype=uint8), offsets
+
+@njit(cache=True)
+def ft_hash_ngrams(word_bytes, min_n, max_n, bucket, max_ngrams, hashes):
+    """ Compute the bucket indices of all character ngrams of an utf-8 encoded word
+
+    Parameters
+    ----------
+    word_bytes : ndarray
+        uint8 view of the utf-8 encoded word, including the "<" and ">" boundary markers.
+    min_n : int
+        Minimum ngram length in characters.
+    max_n : int
+        Maximum ngram length in characters.
+    bucket : int
+        Number of buckets of the ngram vectors.
+    max_ngrams : int
+        Maximum number of bucket indices to compute.
+    hashes : ndarray
+        Output array for the bucket indices. Must hold at least max_ngrams elements.
+
+    Returns
+    -------
+    int
+        Number of bucket indices written to hashes.
+
+    """
+    num_bytes = len(word_bytes)
+    count = 0
+    for i in range(num_bytes):
+        # Skip utf-8 continuation bytes, ngrams always start at a character boundary
+        if (word_bytes[i] & 0xC0) == 0x80:
+            continue
+
+        j, n = i, 1
+        while j < num_bytes and n <= max_n:
+            j += 1
+            while j < num_bytes and (word_bytes[j] & 0xC0) == 0x80:
+                j += 1
+            if n >= min_n and not (n == 1 and (i == 0 or j == num_bytes)):
+                h = int64(FT_HASH_OFFSET)
+                for k in range(i, j):
+                    b = int64(word_bytes[k])
+                    if b >= 0x80:
+                        b |= 0xFFFFFF00  # FastText hashes signed chars
+                    h = ((h ^ b) * FT_HASH_PRIME) & 0xFFFFFFFF
+                hashes[count] = h % bucket
+                count += 1
+                if count == max_ngrams:
+                    return count
+            n += 1
+    return count
+
+@njit(cache=True, fastmath=True)
+def ft_acc(word_bytes, min_n, max_n, bucket, max_ngrams, ngram_vectors, out, weight, hashes, tmp):
+    """ Add the weighted average of the ngram vectors of an oov word to out
+
+    Parameters
+    ----------
+    word_bytes : ndarray
+        uint8 view of the utf-8 encoded word, including the "<" and ">" boundary markers.
+    min_n : int
+        Minimum ngram length in characters.
+    max_n : int
+        Maximum ngram length in characters.
+    bucket : int
+        Number of buckets of the ngram vectors.
+    max_ngrams : int
+        Maximum number of ngrams used for the average.
+    ngram_vectors : ndarray
+        The ngram vectors of the FastText model.
+    out : ndarray
+        Vector the weighted average is added to.
+    weight : float
+        The weight of the oov word.
+    hashes : ndarray
+        int64 buffer for the bucket indices. Must hold at least max_ngrams elements.
+    tmp : ndarray
+        Buffer for the ngram sum. Same size as out, overwritten.
+
+    Returns
+    -------
+    int
+        Number of ngrams used. Nothing is added to out if zero.
+
+    """
+    ngrams = ft_hash_ngrams(word_bytes, min_n, max_n, bucket, max_ngrams, hashes)
+    if ngrams == 0:
+        return 0
+
+    size = out.shape[0]
+    tmp[:] = 0.
+    for i in range(ngrams):
+        row = hashes[i]
+        for d in range(size):
+            tmp[d] += ngram_vectors[row, d]
+    for d in range(size):
+        out[d] += weight * (tmp[d] / ngrams)
+    return ngrams
+
+@njit(cache=True, fastmath=True)
+def ft_oov_vectors(word_buffer, offsets, min_n, max_n, bucket, max_ngrams, ngram_vectors, weight, out):
+    """ Compute the weighted ngram averages of many oov words in a single call
+
+    Parameters
+    ----------
+    word_buffer : ndarray
+        uint8 buffer of the encoded words, see :func:`~fse.models._ft_numba.encode_words`.
+    offsets : ndarray
+        Offsets of the words within word_buffer.
+    min_n : int
+        Minimum ngram length in characters.
+    max_n : int
+        Maximum ngram length in characters.
+    bucket : int
+        Number of buckets of the ngram vectors.
+    max_ngrams : int
+        Maximum number of ngrams used for the average.
+    ngram_vectors : ndarray
+        The ngram vectors of the FastText model.
+    weight : float
+        The weight of the oov words.
+    out : ndarray
+        Zero initialized (words x size) array. Row i receives the average of word i.
+
+    """
+    hashes = empty(max_ngrams, dtype=int64)
+    tmp = empty(out.shape[1], dtype=REAL)
+    for i in range(len(offsets) - 1):
+        ft_acc(
+            word_buffer[offsets[i]:offsets[i + 1]], min_n, max_n, bucket, max_ngrams,
+            ngram_vectors, out[i], weight, hashes, tmp
+        )
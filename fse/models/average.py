@@ -34,22 +34,88 @@ from __future__ import division
 
 from fse.models.base_s2v import BaseSentence2VecModel
 
-from gensim.models.keyedvectors import BaseKeyedVectors
+from gensim.models.keyedvectors import BaseKeyedVectors, Vocab
 from gensim.models.utils_any2vec import ft_ngram_hashes
 
-from numpy import ndarray, float32 as REAL, sum as np_sum, multiply as np_mult,\
-    zeros, max as np_max
+from numpy import ndarray, float32 as REAL, int32 as INT, int64 as INT64, sum as np_sum, \
+    add as np_add, multiply as np_mult, divide as np_divide, asarray, concatenate, cumsum, empty, fromiter, reciprocal, repeat, \
+    zeros
 
 from typing import List
 
+from itertools import chain
+from operator import itemgetter
+from functools import lru_cache
+
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Returned by vocab.get for oov words, so that oov words can be masked out by their index
+OOV_VOCAB = Vocab(index=-1)
+
+# Number of oov words whose ngram hashes are kept by cached_ngram_hashes
+MAX_CACHED_OOV_WORDS = 2**15
+
+try:
+    # Optional: hashes and sums the ngrams of all oov words of a job in a single compiled call
+    from fse.models._ft_numba import encode_words, ft_oov_vectors
+except ImportError:
+    ft_oov_vectors = None
+
+@lru_cache(maxsize=MAX_CACHED_OOV_WORDS)
+def cached_ngram_hashes(word:str, min_n:int, max_n:int, bucket:int, max_ngrams:int) -> ndarray:
+    """Compute the ngram hashes of an oov word. The most recently used words are cached across
+    jobs and training runs, so that frequent oov words are hashed only once.
+
+    Parameters
+    ----------
+    word : str
+        The oov word.
+    min_n : int
+        Minimum ngram length in characters.
+    max_n : int
+        Maximum ngram length in characters.
+    bucket : int
+        Number of buckets of the ngram vectors.
+    max_ngrams : int
+        Maximum number of ngram hashes returned.
+
+    Returns
+    -------
+    ndarray
+        Read-only array of at most max_ngrams bucket indices.
+
+    """
+    ngram_hashes = asarray(ft_ngram_hashes(word, min_n, max_n, bucket, True)[:max_ngrams])
+    ngram_hashes.setflags(write=False)
+    return ngram_hashes
+
+def split_indexed_sentences(indexed_sentences:List[tuple]) -> [ndarray, List[List[str]]]:
+    """Split a sequence of indexed sentences into the sentence indices and the sentences.
+
+    Parameters
+    ----------
+    indexed_sentences : iterable of tuple
+        The sentences and their indices.
+
+    Returns
+    -------
+    ndarray, list
+        Array of the sentence indices and the list of sentences, both in the order of indexed_sentences.
+
+    """
+    unzipped = tuple(zip(*indexed_sentences))
+    if not unzipped:
+        return empty(0, dtype=INT64), []
+    sentences, sent_adrs = unzipped
+    return fromiter(sent_adrs, dtype=INT64, count=len(sent_adrs)), list(sentences)
+
 def train_average_np(model:BaseSentence2VecModel, indexed_sentences:List[tuple], target:ndarray, memory:ndarray) -> [int,int]:
     """Training on a sequence of sentences and update the target ndarray.
 
     Called internally from :meth:`~fse.models.average.Average._do_train_job`.
+    Thin wrapper around :func:`~fse.models.average.train_average_np_split`.
 
     Warnings
     --------
@@ -74,12 +140,39 @@ def train_average_np(model:BaseSentence2VecModel, indexed_sentences:List[tuple],
         Number of effective sentences (non-zero) and effective words in the vocabulary used 
         during training the sentence embedding.
 
+    """
+    sent_adrs, sentences = split_indexed_sentences(indexed_sentences)
+    return train_average_np_split(model, sent_adrs, sentences, target, memory)
+
+def train_average_np_split(model:BaseSentence2VecModel, sent_adrs:ndarray, sentences:List[List[str]], target:ndarray, memory:ndarray) -> [int,int]:
+    """Training on parallel sequences of sentence indices and sentences and update the target ndarray.
+
+    Parameters
+    ----------
+    model : :class:`~fse.models.base_s2v.BaseSentence2VecModel`
+        The BaseSentence2VecModel model instance.
+    sent_adrs : ndarray
+        The index of each sentence, i.e. the row of target to write to.
+    sentences : list of list of str
+        The sentences used to train the model.
+    target : ndarray
+        The target ndarray.
+    memory : ndarray
+        Private memory for each working thread
+
+    Returns
+    -------
+    int, int
+        Number of effective sentences (non-zero) and effective words in the vocabulary used 
+        during training the sentence embedding.
+
     """
     size = model.wv.vector_size
     vocab = model.wv.vocab
 
     w_vectors = model.wv.vectors
     w_weights = model.word_weights
+    unit_weights = model._unit_weights
 
     s_vectors = target
 
@@ -100,49 +193,91 @@ def train_average_np(model:BaseSentence2VecModel, indexed_sentences:List[tuple],
         min_n = model.wv.min_n
         max_n = model.wv.max_n
         bucket = model.wv.bucket
-        oov_weight = np_max(w_weights)
+        oov_weight = model._oov_weight
 
     eff_sentences, eff_words = 0, 0
 
-    if not is_ft:
-        for obj in indexed_sentences:
-            mem.fill(0.)
-            sent = obj[0]
-            sent_adr = obj[1]
-            
-            word_indices = [vocab[word].index for word in sent if word in vocab]
-            eff_sentences += 1
-            if not len(word_indices):
-                continue
-            eff_words += len(word_indices)
+    # Bound once: resolves a word with a single hash probe and returns None for oov words
+    vocab_get = vocab.get
 
-            mem += np_sum(np_mult(w_vectors[word_indices],w_weights[word_indices][:,None]) , axis=0)
-            mem *= 1/len(word_indices)
-            s_vectors[sent_adr] = mem.astype(REAL)
+    if not is_ft:
+        # Resolve all words of the job at once, oov words map to -1
+        sent_lens = fromiter(map(len, sentences), dtype=INT64, count=len(sentences))
+        word_indices = fromiter(
+            (vocab_get(word, OOV_VOCAB).index for word in chain.from_iterable(sentences)),
+            dtype=INT, count=sent_lens.sum()
+        )
+        in_vocab = word_indices >= 0
+
+        # Number of in-vocabulary words of each sentence
+        sent_ends = cumsum(sent_lens)
+        known = concatenate(([0], cumsum(in_vocab)))
+        sent_counts = known[sent_ends] - known[sent_ends - sent_lens]
+
+        eff_sentences += len(sentences)
+        eff_words += int(known[-1])
+
+        # Sentences without any known word are skipped
+        non_empty = sent_counts > 0
+        if non_empty.any():
+            indices = word_indices[in_vocab]
+            lens = sent_counts[non_empty]
+            starts = concatenate(([0], cumsum(lens[:-1])))
+
+            # One gather of all word vectors of the job and one segmented sum over the sentences
+            gathered = w_vectors.take(indices, axis=0)
+            inv_lens = reciprocal(lens.astype(REAL))
+            if unit_weights:
+                sums = np_add.reduceat(gathered, starts, axis=0)
+                sums *= inv_lens[:, None]
+            else:
+                # Scaling the weights by the inverse sentence length first scales the vectors in a single pass
+                gathered *= (w_weights.take(indices) * repeat(inv_lens, lens))[:, None]
+                sums = np_add.reduceat(gathered, starts, axis=0)
+            s_vectors[sent_adrs[non_empty]] = sums
     else:
-        for obj in indexed_sentences:
-            mem.fill(0.)
-            sent = obj[0]
-            sent_adr = obj[1]
-            
+        # Scratch vector, allocated once per job instead of once per word
+        tmp = empty(size, dtype=REAL)
+        # Weighted ngram average of every oov word seen in this job
+        oov_cache = {}
+        if ft_oov_vectors is not None:
+            oov_words = list({word for sent in sentences for word in sent if word not in vocab})
+            if oov_words:
+                word_buffer, offsets = encode_words(oov_words)
+                oov_vectors = zeros((len(oov_words), size), dtype=REAL)
+                ft_oov_vectors(word_buffer, offsets, min_n, max_n, bucket, max_ngrams, ngram_vectors, oov_weight, oov_vectors)
+                oov_cache = dict(zip(oov_words, oov_vectors))
+
+        for sent_adr, sent in zip(sent_adrs, sentences):
             if not len(sent):
                 continue
-            mem = zeros(size, dtype=REAL)
+            mem.fill(0.)
 
             eff_sentences += 1
             eff_words += len(sent) # Counts everything in the sentence
 
             for word in sent:
-                if word in vocab:
-                    word_index = vocab[word].index
-                    mem += w_vectors[word_index] * w_weights[word_index]
+                vocab_obj = vocab_get(word)
+                if vocab_obj is not None:
+                    word_index = vocab_obj.index
+                    if unit_weights:
+                        mem += w_vectors[word_index]
+                    else:
+                        np_mult(w_vectors[word_index], w_weights[word_index], out=tmp)
+                        mem += tmp
                 else:
-                    ngram_hashes = ft_ngram_hashes(word, min_n, max_n, bucket, True)[:max_ngrams]
-                    if len(ngram_hashes) == 0:
-                        continue
-                    mem += oov_weight * (np_sum(ngram_vectors[ngram_hashes], axis=0) / len(ngram_hashes))
-                # Implicit addition of zero if oov does not contain any ngrams
-            s_vectors[sent_adr] = mem / len(sent)
+                    oov_vec = oov_cache.get(word)
+                    if oov_vec is None:
+                        # Only reached without numba. Implicit addition of zero if oov does not contain any ngrams
+                        oov_vec = zeros(size, dtype=REAL)
+                        ngram_hashes = cached_ngram_hashes(word, min_n, max_n, bucket, max_ngrams)
+                        if len(ngram_hashes):
+                            np_sum(ngram_vectors[ngram_hashes], axis=0, out=oov_vec)
+                            oov_vec /= len(ngram_hashes)
+                            oov_vec *= oov_weight
+                        oov_cache[word] = oov_vec
+                    mem += oov_vec
+            np_divide(mem, len(sent), out=s_vectors[sent_adr])
 
     return eff_sentences, eff_words
 
@@ -194,6 +329,8 @@ class Average(BaseSentence2VecModel):
             the wv.vocab and wv.vector elements are required.
         sv_mapfile_path : str, optional
             Optional path to store the sentence-vectors in for very large datasets. Used for memmap.
+            Each job writes its rows in ascending index order. Supply the sentences ordered by their
+            index, so that every job covers a contiguous range of rows and writes to disk sequentially.
         wv_mapfile_path : str, optional
             Optional path to store the word-vectors in for very large datasets. Used for memmap.
             Use sv_mapfile_path and wv_mapfile_path to train disk-to-disk without needing much ram.
@@ -218,6 +355,11 @@ class Average(BaseSentence2VecModel):
 
     def _do_train_job(self, data_iterable:List[tuple], target:ndarray, memory:ndarray) -> [int, int]:
         """ Internal routine which is called on training and performs averaging for all entries in the iterable """
+        # Writing the rows of target in ascending order turns scattered writes into sequential ones,
+        # which matters most for memmapped sentence vectors. Jobs are usually ordered already.
+        indices = list(map(itemgetter(1), data_iterable))
+        if any(i > j for i, j in zip(indices, indices[1:])):
+            data_iterable = sorted(data_iterable, key=itemgetter(1))
         eff_sentences, eff_words = train_average(model=self, indexed_sentences=data_iterable, target=target, memory=memory)
         return eff_sentences, eff_words
 
@@ -240,8 +382,9 @@ class Average(BaseSentence2VecModel):
         """
         pass
     
-    def _check_dtype_santiy(self, **kwargs):
+    def _check_dtype_sanity(self, **kwargs):
         """ Check the dtypes of all child attributes"""
-        pass
+        if self.word_weights.dtype != REAL:
+            raise TypeError(f"type of word_weights is wrong: {self.word_weights.dtype}")
 
     
\ No newline at end of file
@@ -15,8 +15,6 @@ import numpy as np
 
 cimport numpy as np
 
-from gensim.models._utils_any2vec import compute_ngrams_bytes, ft_hash_bytes
-
 from libc.string cimport memset
 from libc.stdio cimport printf
 
@@ -34,6 +32,9 @@ cdef REAL_t ZEROF = <REAL_t>0.0
 DEF MAX_WORDS = 10000
 DEF MAX_NGRAMS = 40
 
+DEF FT_HASH_OFFSET = 2166136261
+DEF FT_HASH_PRIME = 16777619
+
 cdef init_base_s2v_config(BaseSentenceVecsConfig *c, model, target, memory):
     """Load BaseAny2Vec parameters into a BaseSentenceVecsConfig struct.
 
@@ -83,7 +84,7 @@ cdef init_ft_s2v_config(FTSentenceVecsConfig *c, model, target, memory):
     c[0].max_n = model.wv.max_n
     c[0].bucket = model.wv.bucket
 
-    c[0].oov_weight = <REAL_t>np.max(model.word_weights)
+    c[0].oov_weight = <REAL_t>model._oov_weight
 
     c[0].mem = <REAL_t *>(np.PyArray_DATA(memory[0]))
 
@@ -96,6 +97,64 @@ cdef init_ft_s2v_config(FTSentenceVecsConfig *c, model, target, memory):
 
     c[0].sentence_vectors = <REAL_t *>(np.PyArray_DATA(target))
 
+cdef uINT_t compute_ngram_hashes(const unsigned char *bytez, size_t num_bytes, int min_n, int max_n, int bucket, uINT_t *hashes, uINT_t max_ngrams) nogil:
+    """Compute the bucket indices of all character ngrams of an utf-8 encoded word.
+
+    Equivalent to :func:`~gensim.models._utils_any2vec.compute_ngrams_bytes` followed by
+    :func:`~gensim.models._utils_any2vec.ft_hash_bytes`, but works on the raw bytes
+    without creating an intermediate Python object for every ngram.
+
+    Parameters
+    ----------
+    bytez : const unsigned char *
+        The utf-8 encoded word, including the "<" and ">" boundary markers.
+    num_bytes : size_t
+        The length of bytez.
+    min_n : int
+        Minimum ngram length in characters.
+    max_n : int
+        Maximum ngram length in characters.
+    bucket : int
+        The number of buckets of the ngram vectors.
+    hashes : uINT_t *
+        Output array to write the bucket indices to.
+    max_ngrams : uINT_t
+        Maximum number of bucket indices written to hashes.
+
+    Returns
+    -------
+    uINT_t
+        The number of bucket indices written to hashes.
+
+    """
+    cdef:
+        size_t i, j, k
+        int n
+        uINT_t h
+        uINT_t count = ZERO
+
+    for i in range(num_bytes):
+        # Skip utf-8 continuation bytes, ngrams always start at a character boundary
+        if (bytez[i] & 0xC0) == 0x80:
+            continue
+
+        j, n = i, 1
+        while j < num_bytes and n <= max_n:
+            j += 1
+            while j < num_bytes and (bytez[j] & 0xC0) == 0x80:
+                j += 1
+            if n >= min_n and not (n == 1 and (i == 0 or j == num_bytes)):
+                h = <uINT_t>FT_HASH_OFFSET
+                for k in range(i, j):
+                    h = h ^ <uINT_t>(<signed char>bytez[k])
+                    h = h * <uINT_t>FT_HASH_PRIME
+                hashes[count] = h % <uINT_t>bucket
+                count += ONE
+                if count == max_ngrams:
+                    return count
+            n += 1
+    return count
+
 cdef object populate_base_s2v_config(BaseSentenceVecsConfig *c, vocab, indexed_sentences):
     """Prepare C structures for BaseAny2VecModel so we can go "full C" and release the Python GIL.
 
@@ -125,11 +184,13 @@ cdef object populate_base_s2v_config(BaseSentenceVecsConfig *c, vocab, indexed_s
 
     c.sentence_boundary[0] = ZERO
 
+    vocab_get = vocab.get
+
     for obj in indexed_sentences:
         if not obj[0]:
             continue
         for token in obj[0]:
-            word = vocab[token] if token in vocab else None # Vocab obj
+            word = vocab_get(token) # Vocab obj
             if word is None:
                 continue
             c.word_indices[eff_words] = <uINT_t>word.index
@@ -173,28 +234,31 @@ cdef object populate_ft_s2v_config(FTSentenceVecsConfig *c, vocab, indexed_sente
     cdef uINT_t eff_words = ZERO    # Effective words encountered in a sentence
     cdef uINT_t eff_sents = ZERO    # Effective sentences encountered
 
+    cdef bytes encoded
+
     c.sentence_boundary[0] = ZERO
 
+    vocab_get = vocab.get
+
     for obj in indexed_sentences:
         if not obj[0]:
             continue
         for token in obj[0]:
             c.sent_adresses[eff_words] = <uINT_t>obj[1]
-            if token in vocab:
+            word = vocab_get(token)
+            if word is not None:
                 # In Vocabulary
-                word = vocab[token]
                 c.word_indices[eff_words] = <uINT_t>word.index    
                 c.subwords_idx_len[eff_words] = ZERO
             else:
                 # OOV words --> write ngram indices to memory
                 c.word_indices[eff_words] = ZERO
 
-                encoded_ngrams = compute_ngrams_bytes(token, c.min_n, c.max_n)
-                hashes = [ft_hash_bytes(n) % c.bucket for n in encoded_ngrams]
-
-                c.subwords_idx_len[eff_words] = <uINT_t>min(len(encoded_ngrams), MAX_NGRAMS)
-                for i, h in enumerate(hashes[:MAX_NGRAMS]):
-                    c.subwords_idx[(eff_words * MAX_NGRAMS) + i] = <uINT_t>h
+                encoded = ('<%s>' % token).encode("utf-8")
+                c.subwords_idx_len[eff_words] = compute_ngram_hashes(
+                    encoded, len(encoded), c.min_n, c.max_n, c.bucket,
+                    &c.subwords_idx[eff_words * MAX_NGRAMS], MAX_NGRAMS
+                )
             
             eff_words += ONE
 
@@ -129,6 +129,7 @@ class BaseSentence2VecModel(SaveLoad):
         self.prep = BaseSentence2VecPreparer()
 
         self.word_weights = ones(len(self.wv.vocab), REAL)
+        self._cache_word_weights()
 
     def __str__(self) -> str:
         """ Human readable representation of the model's state.
@@ -452,10 +453,15 @@ class BaseSentence2VecModel(SaveLoad):
         """ Check the sanity of all child paramters """
         raise NotImplementedError()
 
-    def _check_dtype_santiy(self, **kwargs):
+    def _check_dtype_sanity(self, **kwargs):
         """ Check the dtypes of all child attributes """
         raise NotImplementedError()
 
+    def _cache_word_weights(self):
+        """ Cache properties of the word weights, so that the training routines do not scan them for every job """
+        self._unit_weights = bool((self.word_weights == 1.).all())
+        self._oov_weight = REAL(self.word_weights.max()) if len(self.word_weights) else REAL(0.)
+
     @classmethod
     def load(cls, *args, **kwargs):
         """ Load a previously saved :class:`~fse.models.base_s2v.BaseSentence2VecModel`.
@@ -478,6 +484,10 @@ class BaseSentence2VecModel(SaveLoad):
         if model.wv_mapfile_path is not None:
             model._load_all_vectors_from_disk(model.wv_mapfile_path)
         model.wv_mapfile_shapes = None
+
+        # Models stored with other weight dtypes are converted once, so training never has to cast
+        if getattr(model, "word_weights", None) is not None and model.word_weights.dtype != REAL:
+            model.word_weights = model.word_weights.astype(REAL)
         return model
 
     def save(self, *args, **kwargs):
@@ -627,7 +637,8 @@ class BaseSentence2VecModel(SaveLoad):
         # Preform post-tain calls (i.e weight computation)
         self._pre_train_calls(**statistics)
         self._check_parameter_sanity()
-        self._check_dtype_santiy()
+        self._check_dtype_sanity()
+        self._cache_word_weights()
         start_time = time()
 
         logger.info(f"begin training")
@@ -668,19 +679,25 @@ class BaseSentence2VecModel(SaveLoad):
         statistics = self.scan_sentences(sentences)
 
         output = zeros((statistics["max_index"], self.sv.vector_size), dtype=REAL)
-        mem = self._get_thread_working_mem()
-        
-        job_batch, batch_size = [], 0
-        for data_idx, data in enumerate(sentences):
-            data_length = len(data[0])
-            if batch_size + data_length <= self.batch_words:
-                job_batch.append(data)
-                batch_size += data_length
-            else:
+        self._cache_word_weights()
+
+        if self.workers > 1:
+            # Each job writes to its own rows of output, so the workers do not need to synchronize
+            self._train_manager(data_iterable=sentences, total_sentences=statistics["total_sentences"], target=output)
+        else:
+            mem = self._get_thread_working_mem()
+
+            job_batch, batch_size = [], 0
+            for data_idx, data in enumerate(sentences):
+                data_length = len(data[0])
+                if batch_size + data_length <= self.batch_words:
+                    job_batch.append(data)
+                    batch_size += data_length
+                else:
+                    self._do_train_job(data_iterable=job_batch, target=output, memory=mem)
+                    job_batch, batch_size = [data], data_length
+            if job_batch:
                 self._do_train_job(data_iterable=job_batch, target=output, memory=mem)
-                job_batch, batch_size = [data], data_length
-        if job_batch:
-            self._do_train_job(data_iterable=job_batch, target=output, memory=mem)
 
         self._post_inference_calls(output=output)
 
@@ -688,7 +705,7 @@ class BaseSentence2VecModel(SaveLoad):
             output = _l2_norm(output)
         return output
 
-    def _train_manager(self, data_iterable:List[tuple], total_sentences:int=None, queue_factor:int=2, report_delay:int=5):
+    def _train_manager(self, data_iterable:List[tuple], total_sentences:int=None, queue_factor:int=2, report_delay:int=5, target:ndarray=None):
         """ Manager for the multi-core implementation. Directly adapted from gensim
         
         Parameters
@@ -701,36 +718,43 @@ class BaseSentence2VecModel(SaveLoad):
             Multiplier for size of queue -> size = number of workers * queue_factor.
         report_delay : int
             Number of seconds between two consecutive progress report messages in the logger.
+        target : ndarray, optional
+            The ndarray the workers write the sentence vectors to. Defaults to sv.vectors.
 
         """
         job_queue = Queue(maxsize=queue_factor * self.workers)
         progress_queue = Queue(maxsize=(queue_factor + 1) * self.workers)
+        failed = threading.Event()
 
         # WORKING Threads
         workers = [
             threading.Thread(
                 target=self._worker_loop,
-                args=(job_queue, progress_queue))
+                args=(job_queue, progress_queue, target, failed))
             for _ in range(self.workers)
         ]
         # JOB PRODUCER
         workers.append(
             threading.Thread(
             target=self._job_producer,
-            args=(data_iterable, job_queue))
+            args=(data_iterable, job_queue, failed))
         )
 
         for thread in workers:
             thread.daemon = True  # make interrupting the process with ctrl+c easier
             thread.start()
 
-        jobs, eff_sentences, eff_words = self._log_train_progress(
+        jobs, eff_sentences, eff_words, error = self._log_train_progress(
             progress_queue, total_sentences=total_sentences,
             report_delay=report_delay
         )
+        for thread in workers:
+            thread.join()
+        if error is not None:
+            raise error
         return jobs, eff_sentences, eff_words
 
-    def _worker_loop(self, job_queue, progress_queue):
+    def _worker_loop(self, job_queue, progress_queue, target:ndarray=None, failed:threading.Event=None):
         """ Train the model, lifting batches of data from the queue.
 
         This function will be called in parallel by multiple workers (threads or processes) to make
@@ -746,8 +770,17 @@ class BaseSentence2VecModel(SaveLoad):
                 * Size of job processed
                 * Effective sentences encountered in traning
                 * Effective words encountered in traning
+            An exception raised by a job is put on the queue instead.
+        target : ndarray, optional
+            The ndarray to write the sentence vectors to. Defaults to sv.vectors.
+        failed : threading.Event, optional
+            Set once any worker failed. The remaining jobs are then drained without being processed.
 
         """
+        if target is None:
+            target = self.sv.vectors
+        if failed is None:
+            failed = threading.Event()
         mem = self._get_thread_working_mem()
         jobs_processed = 0
         while True:
@@ -756,12 +789,20 @@ class BaseSentence2VecModel(SaveLoad):
                 progress_queue.put(None)
                 # no more jobs => quit this worker
                 break  
-            eff_sentences, eff_words = self._do_train_job(data_iterable=job, target=self.sv.vectors, memory=mem)
+            if failed.is_set():
+                # Keep consuming, otherwise the job producer blocks on a full queue
+                continue
+            try:
+                eff_sentences, eff_words = self._do_train_job(data_iterable=job, target=target, memory=mem)
+            except Exception as e:
+                failed.set()
+                progress_queue.put(e)
+                continue
             progress_queue.put((len(job), eff_sentences, eff_words))
             jobs_processed += 1
         logger.debug(f"worker exiting, processed {jobs_processed} jobs")
     
-    def _job_producer(self, data_iterable:List[tuple], job_queue:Queue):
+    def _job_producer(self, data_iterable:List[tuple], job_queue:Queue, failed:threading.Event=None):
         """ Fill the jobs queue using the data found in the input stream.
 
         Each job is represented as a batch of tuple
@@ -773,13 +814,20 @@ class BaseSentence2VecModel(SaveLoad):
         job_queue : Queue of (list of tuple)
             A queue of jobs still to be processed. The worker will take up jobs from this queue.
             Each job is represented as a batch of tuple.
+        failed : threading.Event, optional
+            Set once any worker failed. No further data is read from data_iterable.
 
         """
+        if failed is None:
+            failed = threading.Event()
 
         job_batch, batch_size = [], 0
         job_no = 0
 
         for data_idx, data in enumerate(data_iterable):
+            if failed.is_set():
+                job_batch = []
+                break
             data_length = len(data[0])
             if batch_size + data_length <= self.batch_words:
                 job_batch.append(data)
@@ -814,11 +862,13 @@ class BaseSentence2VecModel(SaveLoad):
 
         Returns
         -------
-        int, int, int
-            number of jobs, effective sentences, and effective words in traning
+        int, int, int, Exception
+            number of jobs, effective sentences, and effective words in traning,
+            and the first exception raised by a worker or None
 
         """
         jobs, eff_sentences, eff_words = 0, 0, 0
+        error = None
         unfinished_worker_count = self.workers
         start_time = time()
         sentence_inc = 0
@@ -826,7 +876,11 @@ class BaseSentence2VecModel(SaveLoad):
             report = progress_queue.get()
             if report is None:  # a thread reporting that it finished
                 unfinished_worker_count -= 1
-                logger.info(f"worker thread finished; awaiting finish of {unfinished_worker_count} more threads")
+                logger.debug(f"worker thread finished; awaiting finish of {unfinished_worker_count} more threads")
+                continue
+            if isinstance(report, Exception):
+                if error is None:
+                    error = report
                 continue
 
             j, s, w = report
@@ -843,7 +897,7 @@ class BaseSentence2VecModel(SaveLoad):
                 ))
                 sentence_inc = eff_sentences
         
-        return jobs, eff_sentences, eff_words
+        return jobs, eff_sentences, eff_words, error
 
 class BaseSentence2VecPreparer(SaveLoad):
     """ Contains helper functions to perpare the weights for the training of BaseSentence2VecModel """
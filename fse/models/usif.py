@@ -94,7 +94,7 @@ class uSIF(Average):
         else:
             logger.info(f"no removal of principal components")
     
-    def _check_dtype_santiy(self):
+    def _check_dtype_sanity(self):
         """ Check the dtypes of all attributes """
         if self.word_weights.dtype != REAL:
             raise TypeError(f"type of word_weights is wrong: {self.word_weights.dtype}")
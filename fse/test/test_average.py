@@ -11,11 +11,13 @@ Automated tests for checking the average model.
 import logging
 import unittest
 
+from unittest.mock import patch
+
 from pathlib import Path
 
 import numpy as np
 
-from fse.models.average import Average, train_average_np
+from fse.models.average import Average, train_average_np, split_indexed_sentences, cached_ngram_hashes, ft_oov_vectors
 from fse.models.base_s2v import EPS
 
 from gensim.models import Word2Vec, FastText
@@ -52,6 +54,29 @@ class TestAverageFunctions(unittest.TestCase):
         self.assertTrue((164.5 == self.model.sv[1]).all())
         self.assertTrue((self.model.wv.vocab["go"].index == self.model.sv[2]).all())
     
+    def test_average_train_np_w2v_oov_sentence(self):
+        self.model.sv.vectors = np.zeros_like(self.model.sv.vectors, dtype=np.float32)
+        mem = self.model._get_thread_working_mem()
+        sentences = [(["12345", "678910"], 0), (["go", "go"], 1)]
+        output = train_average_np(self.model, sentences, self.model.sv.vectors, mem)
+        self.assertEqual((2, 2), output)
+        self.assertTrue((0 == self.model.sv[0]).all())
+        self.assertTrue((self.model.wv.vocab["go"].index == self.model.sv[1]).all())
+
+    def test_split_indexed_sentences(self):
+        sent_adrs, sentences = split_indexed_sentences(self.sentences)
+        self.assertEqual([0, 1, 2, 3], sent_adrs.tolist())
+        self.assertEqual([s for s, _ in self.sentences], sentences)
+        sent_adrs, sentences = split_indexed_sentences([])
+        self.assertEqual((0, []), (len(sent_adrs), sentences))
+
+    def test_cached_ngram_hashes(self):
+        from gensim.models.utils_any2vec import ft_ngram_hashes
+        hashes = cached_ngram_hashes("12345678910111213", 3, 6, 2000000, 40)
+        self.assertEqual(list(ft_ngram_hashes("12345678910111213", 3, 6, 2000000, True)[:40]), list(hashes))
+        self.assertFalse(hashes.flags.writeable)
+        self.assertIs(hashes, cached_ngram_hashes("12345678910111213", 3, 6, 2000000, 40))
+
     def test_average_train_cy_w2v(self):
         self.model.sv.vectors = np.zeros_like(self.model.sv.vectors, dtype=np.float32)
         mem = self.model._get_thread_working_mem()
@@ -137,6 +162,31 @@ class TestAverageFunctions(unittest.TestCase):
 
         self.assertTrue(np.allclose(m1.sv.vectors, m2.sv.vectors, atol=1e-6))
 
+    def test_cy_equal_np_w2v_weighted(self):
+        # Random word weights bypass _check_parameter_sanity to exercise the weighted path
+        weights = np.random.RandomState(42).uniform(size=len(W2V.wv.vocab)).astype(np.float32)
+
+        m1 = Average(W2V)
+        m1.word_weights = weights
+        m1._cache_word_weights()
+        m1.prep.prepare_vectors(sv=m1.sv, total_sentences=len(self.sentences), update=False)
+        m1._pre_train_calls()
+        mem1 = m1._get_thread_working_mem()
+        o1 = train_average_np(m1, self.sentences, m1.sv.vectors, mem1)
+
+        m2 = Average(W2V)
+        m2.word_weights = weights
+        m2._cache_word_weights()
+        m2.prep.prepare_vectors(sv=m2.sv, total_sentences=len(self.sentences), update=False)
+        m2._pre_train_calls()
+        mem2 = m2._get_thread_working_mem()
+
+        from fse.models.average_inner import train_average_cy
+        o2 = train_average_cy(m2, self.sentences, m2.sv.vectors, mem2)
+
+        self.assertEqual(o1, o2)
+        self.assertTrue(np.allclose(m1.sv.vectors, m2.sv.vectors, atol=1e-6))
+
     def test_cy_equal_np_ft_random(self):
         ft = FastText(size=20, min_count=1)
         ft.build_vocab(SENTENCES)
@@ -161,6 +211,33 @@ class TestAverageFunctions(unittest.TestCase):
         self.assertEqual(o1, o2)
         self.assertTrue(np.allclose(m1.sv.vectors, m2.sv.vectors, atol=1e-6))
 
+    def test_cy_equal_np_ft_oov(self):
+        ft = FastText(size=20, min_count=1)
+        ft.build_vocab(SENTENCES)
+        ft.wv.vectors_ngrams = np.random.RandomState(42).uniform(
+            -1, 1, size=ft.wv.vectors_ngrams.shape
+        ).astype(np.float32)
+        # Non-ASCII oov words exercise the signed char hashing of multi-byte characters
+        sentences = self.sentences + [(["héllo", "日本語", "12345", "😀", "ñandú"], 4)]
+
+        m1 = Average(ft)
+        m1.prep.prepare_vectors(sv=m1.sv, total_sentences=len(sentences), update=False)
+        m1._pre_train_calls()
+        mem1 = m1._get_thread_working_mem()
+        with patch("fse.models.average.ft_oov_vectors", None):
+            o1 = train_average_np(m1, sentences, m1.sv.vectors, mem1)
+
+        m2 = Average(ft)
+        m2.prep.prepare_vectors(sv=m2.sv, total_sentences=len(sentences), update=False)
+        m2._pre_train_calls()
+        mem2 = m2._get_thread_working_mem()
+
+        from fse.models.average_inner import train_average_cy
+        o2 = train_average_cy(m2, sentences, m2.sv.vectors, mem2)
+
+        self.assertEqual(o1, o2)
+        self.assertTrue(np.allclose(m1.sv.vectors, m2.sv.vectors, atol=1e-6))
+
     def test_do_train_job(self):
         self.model.prep.prepare_vectors(sv=self.model.sv, total_sentences=len(SENTENCES), update=True)
         mem = self.model._get_thread_working_mem()
@@ -170,6 +247,20 @@ class TestAverageFunctions(unittest.TestCase):
         )
         self.assertEqual((104,DIM), self.model.sv.vectors.shape)
 
+    def test_do_train_job_shuffled(self):
+        self.model.prep.prepare_vectors(sv=self.model.sv, total_sentences=len(SENTENCES), update=True)
+        mem = self.model._get_thread_working_mem()
+        job = [(s, i) for i,s in enumerate(SENTENCES)]
+        shuffled = [job[i] for i in np.random.RandomState(42).permutation(len(job))]
+
+        ordered_target = np.zeros((len(SENTENCES), DIM), dtype=np.float32)
+        shuffled_target = np.zeros((len(SENTENCES), DIM), dtype=np.float32)
+        self.assertEqual(
+            self.model._do_train_job(job, target=ordered_target, memory=mem),
+            self.model._do_train_job(shuffled, target=shuffled_target, memory=mem)
+        )
+        self.assertTrue(np.allclose(ordered_target, shuffled_target, atol=1e-6))
+
     def test_train(self):
         self.assertEqual((100,1450), self.model.train([(s, i) for i,s in enumerate(SENTENCES)]))
     
@@ -209,6 +300,62 @@ class TestAverageFunctions(unittest.TestCase):
         p_res.unlink()
         p_target.unlink()
 
+    def test_infer_multi_workers(self):
+        se1 = Average(W2V)
+        se2 = Average(W2V, workers=2)
+        se2.batch_words = 100
+        sentences = [(s, i) for i,s in enumerate(SENTENCES)]
+        self.assertTrue((se1.infer(sentences) == se2.infer(sentences)).all())
+
+    def test_infer_inplace_word_weights(self):
+        se = Average(W2V)
+        sentences = [(s, i) for i,s in enumerate(SENTENCES)]
+        unit = se.infer(sentences)
+        se.word_weights[:] = .5
+        with patch("fse.models.average.train_average", train_average_np):
+            self.assertTrue(np.allclose(.5 * unit, se.infer(sentences), atol=1e-6))
+        self.assertTrue(np.allclose(.5 * unit, se.infer(sentences), atol=1e-6))
+
+    @unittest.skipIf(ft_oov_vectors is None, "numba not installed")
+    def test_average_train_np_ft_numba_equal_python(self):
+        ft = FastText(size=20, min_count=1)
+        ft.build_vocab(SENTENCES)
+        sentences = self.sentences + [(["héllo", "日本語", "12345", "😀"], 4)]
+
+        m1 = Average(ft)
+        m1.prep.prepare_vectors(sv=m1.sv, total_sentences=len(sentences), update=False)
+        m1._pre_train_calls()
+        mem1 = m1._get_thread_working_mem()
+        o1 = train_average_np(m1, sentences, m1.sv.vectors, mem1)
+
+        m2 = Average(ft)
+        m2.prep.prepare_vectors(sv=m2.sv, total_sentences=len(sentences), update=False)
+        m2._pre_train_calls()
+        mem2 = m2._get_thread_working_mem()
+        with patch("fse.models.average.ft_oov_vectors", None):
+            o2 = train_average_np(m2, sentences, m2.sv.vectors, mem2)
+
+        self.assertEqual(o1, o2)
+        self.assertTrue(np.allclose(m1.sv.vectors, m2.sv.vectors, atol=1e-6))
+
+    @unittest.skipIf(ft_oov_vectors is None, "numba not installed")
+    def test_ft_hash_ngrams_numba(self):
+        from fse.models._ft_numba import encode_words, ft_hash_ngrams
+        from gensim.models.utils_any2vec import ft_ngram_hashes
+        hashes = np.empty(40, dtype=np.int64)
+        words = ["12345", "héllo", "12345678910111213"]
+        word_buffer, offsets = encode_words(words)
+        for i, word in enumerate(words):
+            word_bytes = word_buffer[offsets[i]:offsets[i + 1]]
+            ngrams = ft_hash_ngrams(word_bytes, 3, 6, 2000000, 40, hashes)
+            self.assertEqual(list(ft_ngram_hashes(word, 3, 6, 2000000, True)[:40]), list(hashes[:ngrams]))
+
+    def test_check_dtype_sanity(self):
+        se = Average(W2V)
+        se.word_weights = np.ones_like(se.word_weights, dtype=np.float64)
+        with self.assertRaises(TypeError):
+            se._check_dtype_sanity()
+
     def test_check_parameter_sanity(self):
         se = Average(W2V)
         se.word_weights = np.full(20, 2., dtype=np.float32)
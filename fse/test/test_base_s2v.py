@@ -98,6 +98,26 @@ class TestBaseSentence2VecModelFunctions(unittest.TestCase):
         self.assertEqual(se.workers, se2.workers)
         p.unlink()
 
+    def test_cache_word_weights(self):
+        se = BaseSentence2VecModel(W2V)
+        self.assertTrue(se._unit_weights)
+        se.word_weights[0] = 2.
+        se._cache_word_weights()
+        self.assertFalse(se._unit_weights)
+        self.assertEqual(2., se._oov_weight)
+        self.assertEqual(np.float32, se._oov_weight.dtype)
+
+    def test_infer_caches_word_weights(self):
+        se = BaseSentence2VecModel(W2V)
+        def temp_train_job(data_iterable, target, memory):
+            self.assertFalse(se._unit_weights)
+            return 0, 0
+        def pass_method(**kwargs): pass
+        se._post_inference_calls = pass_method
+        se._do_train_job = temp_train_job
+        se.word_weights[0] = .5
+        se.infer([(s, i) for i,s in enumerate(SENTENCES)])
+
     def test_save_load_with_memmap(self):
         ft = FastText(min_count=1, size=5)
         ft.build_vocab(SENTENCES)
@@ -242,7 +262,7 @@ class TestBaseSentence2VecModelFunctions(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             se._check_parameter_sanity()
         with self.assertRaises(NotImplementedError):
-            se._check_dtype_santiy()  
+            se._check_dtype_sanity()  
         with self.assertRaises(NotImplementedError):
             se._post_inference_calls()  
 
@@ -412,6 +432,31 @@ class TestBaseSentence2VecModelFunctions(unittest.TestCase):
         job_output = se._train_manager(data_iterable=[(s, i) for i,s in enumerate(SENTENCES)], total_sentences=len(SENTENCES),report_delay=0.01)
         self.assertEqual((100,200,300), job_output)
 
+    def test_train_manager_worker_error(self):
+        se = BaseSentence2VecModel(W2V, workers=2)
+        def temp_train_job(data_iterable, target, memory):
+            raise ValueError("job failed")
+        se._do_train_job = temp_train_job
+        with self.assertRaises(ValueError):
+            se._train_manager(data_iterable=[(s, i) for i,s in enumerate(SENTENCES)], total_sentences=len(SENTENCES),report_delay=0.01)
+
+    def test_train_manager_worker_error_stops_producer(self):
+        se = BaseSentence2VecModel(W2V, workers=2)
+        def temp_train_job(data_iterable, target, memory):
+            raise ValueError("job failed")
+        se._do_train_job = temp_train_job
+
+        total_sentences = 1000 * len(SENTENCES)
+        consumed = []
+        def data_iterable():
+            for i in range(total_sentences):
+                consumed.append(i)
+                yield (SENTENCES[i % len(SENTENCES)], i)
+
+        with self.assertRaises(ValueError):
+            se._train_manager(data_iterable=data_iterable(), total_sentences=total_sentences, report_delay=0.01)
+        self.assertLess(len(consumed), total_sentences)
+
     def test_infer_method(self):
         se = BaseSentence2VecModel(W2V)
         def temp_train_job(data_iterable, target, memory):
@@ -74,17 +74,17 @@ class TestSIFFunctions(unittest.TestCase):
     def test_dtype_sanity_word_weights(self):
         self.model.word_weights = np.ones_like(self.model.word_weights, dtype=int)
         with self.assertRaises(TypeError):
-            self.model._check_dtype_santiy()
+            self.model._check_dtype_sanity()
     
     def test_dtype_sanity_svd_vals(self):
         self.model.svd_res = (np.ones_like(self.model.word_weights, dtype=int), np.array(0, dtype=np.float32))
         with self.assertRaises(TypeError):
-            self.model._check_dtype_santiy()
+            self.model._check_dtype_sanity()
 
     def test_dtype_sanity_svd_vecs(self):
         self.model.svd_res = (np.array(0, dtype=np.float32), np.ones_like(self.model.word_weights, dtype=int))
         with self.assertRaises(TypeError):
-            self.model._check_dtype_santiy()
+            self.model._check_dtype_sanity()
     
     def test_compute_sif_weights(self):
         cs = 1095661426
@@ -117,5 +117,8 @@ setup(
         'wordfreq >= 2.2.1',
         'psutil'
     ],
+    extras_require={
+        'numba': ['numba >= 0.45.0'],
+    },
     include_package_data=True,
 )